@@ -37,6 +37,8 @@ if TYPE_CHECKING:
     from neocord.api.state import State
 
 class Messageable:
+    __slots__ = ()
+
     if TYPE_CHECKING:
         _state: State
 
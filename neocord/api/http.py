@@ -78,8 +78,9 @@ class HTTPClient(Routes):
         for tries in range(5):
             try:
                 async with self.session.request(route.request, url, headers=headers, **kwargs) as response: # type: ignore
+                    data: Union[str, Dict[str, Any], None] = None
                     if not response.status >= 500:
-                        data: Union[str, Dict[str, Any]] = await self._get_data(response) # type: ignore
+                        data = await self._get_data(response)
 
                     if response.status < 300:
                         # successful request
@@ -110,16 +111,11 @@ class HTTPClient(Routes):
 
                     # TODO: Add more handlers here.
 
-                    if response.status == 404:
-                        raise NotFound(response, data) # type: ignore
-                    if response.status in {403, 401}:
-                        raise Forbidden(response, data) # type: ignore
                     if response.status in {500, 502, 504}:
                         await asyncio.sleep(1 + tries * 2)
                         continue
-                    else:
-                        print(data)
-                        raise HTTPError(response, data)
+
+                    raise HTTPError.from_response(response, data) # type: ignore
 
             except OSError as err:
                 if tries < 4 and err.errno in (54, 10054):
@@ -40,6 +40,19 @@ if TYPE_CHECKING:
     from neocord.models.message import Message
     from neocord.models.guild import Guild
 
+def _get_default_loop(use_uvloop: bool = False) -> asyncio.AbstractEventLoop:
+    if not use_uvloop:
+        return asyncio.get_event_loop()
+
+    import uvloop # type: ignore
+
+    # only a loop for the client is created, the global event loop policy
+    # is left untouched. it is still set as the current loop so the objects
+    # created afterwards are bound to it.
+    loop = uvloop.new_event_loop()
+    asyncio.set_event_loop(loop)
+    return loop
+
 class Client:
     """
     Represents a client that interacts with the Discord API. This is the starter
@@ -54,6 +67,10 @@ class Client:
     loop: :class:`asyncio.AbstractEventLoop`
         The asyncio event loop to use. if not provided, it will be obtained by calling
         :func:`asyncio.get_event_loop` function.
+    use_uvloop: :class:`bool`
+        Whether to use `uvloop <https://github.com/MagicStack/uvloop>`_ as the event loop
+        implementation. This requires uvloop to be installed and has no effect if ``loop``
+        is passed. Defaults to ``False``.
     session: :class:`aiohttp.ClientSession`
         The aiohttp session to use in HTTP or websocket operations. if not provided, Library
         creates it's own session.
@@ -79,7 +96,7 @@ class Client:
         intents: GatewayIntents
 
     def __init__(self, **params: Any) -> None:
-        self.loop  = params.get('loop') or asyncio.get_event_loop()
+        self.loop = params.get('loop') or _get_default_loop(params.get('use_uvloop', False))
         self.intents = params.get('intents') or GatewayIntents.unprivileged()
         self.message_cache_limit = params.get('message_cache_limit', 500)
 
@@ -106,14 +123,16 @@ class Client:
         if not self._ready.is_set():
             return
 
+        # the same task name is shared by every task of this dispatch.
+        task_name = f'neocord-event-dispatch: {event}'
+
         # call the event first
         coro = getattr(self, f'on_{event}', None)
         if coro:
-            asyncio.create_task(coro(), name=f'neocord-event-dispatch: {event}')
+            asyncio.create_task(coro(), name=task_name)
 
-        try:
-            listeners = self._listeners[event]
-        except KeyError:
+        listeners = self._listeners.get(event)
+        if not listeners:
             return
 
         to_remove: List[Callable[..., Any]] = []
@@ -121,21 +140,21 @@ class Client:
 
         for listener in listeners:
             coro = listener(*args)
-            asyncio.create_task(coro, name='neocord-event-dispatch: {}'.format(event))
-            try:
-                options = listener.__neocord_event_listener_options__
-            except AttributeError:
-                options = {}
-
-            if options.get('once', False):
+            asyncio.create_task(coro, name=task_name)
+            if getattr(listener, '__neocord_once__', False):
                 to_remove.append(listener)
 
         for listener in to_remove:
             try:
-                self._listeners[event].remove(listener)
-            except:
+                listeners.remove(listener)
+            except ValueError:
                 continue
 
+        if not listeners:
+            # don't keep empty lists around for the events that are no
+            # longer listened to e.g the ones used in wait_for()
+            del self._listeners[event]
+
     async def connect_hook(self):
         """
         A hook that is called whenever the client connects initially to
@@ -230,9 +249,11 @@ class Client:
             await self.connect()
 
         if self.loop.is_running():
-            asyncio.ensure_future(runner())
-        else:
-            self.loop.run_until_complete(runner())
+            logger.warning('run() was called while the event loop is already running, consider using start() instead.')
+            asyncio.ensure_future(runner(), loop=self.loop)
+            return
+
+        self.loop.run_until_complete(runner())
 
     # listeners
 
@@ -279,10 +300,7 @@ class Client:
         event: :class:`str`
             The event name to clear listeners for.
         """
-        try:
-            del self._listeners[event]
-        except KeyError:
-            return
+        self._listeners.pop(event, None)
 
     def get_listeners(self, event: str, *, include_temporary: bool = False) -> List[Callable[..., Any]]:
         """
@@ -301,13 +319,12 @@ class Client:
         -------
         The list of event listeners callbacks.
         """
-        try:
-            listeners = self._listeners[event]
-        except KeyError:
+        listeners = self._listeners.get(event)
+        if listeners is None:
             return []
 
         if not include_temporary:
-            listeners = [l for l in listeners if not l.__neocord_event_listener_options__.get('once', False)]
+            listeners = [l for l in listeners if not getattr(l, '__neocord_once__', False)]
 
         return listeners
 
@@ -344,8 +361,7 @@ class Client:
         if name.startswith('on_'):
             name = name[3:]
 
-        listener.__neocord_event_listener_options__ = {}
-        listener.__neocord_event_listener_options__['once'] = once
+        listener.__neocord_once__ = once
 
         try:
             self._listeners[name].append(listener)
@@ -354,6 +370,29 @@ class Client:
 
         return listener
 
+    def remove_listener(self, listener: Callable[..., Any], name: str) -> None:
+        """
+        Removes an event listener from the bot.
+
+        This method will not raise the error if the listener is not
+        registered for the provided event.
+
+        Parameters
+        ----------
+        listener:
+            The async function that was added as listener.
+        name: :class:`str`
+            The name of event that the listener listens to.
+        """
+        if name.startswith('on_'):
+            name = name[3:]
+
+        listeners = self._listeners.get(name)
+        if listeners and listener in listeners:
+            listeners.remove(listener)
+            if not listeners:
+                del self._listeners[name]
+
     def on(self, *args, **kwargs):
         """
         A decorator that registers a listener to listen to gateway events.
@@ -442,7 +481,18 @@ class Client:
                 self.add_listener(listener, event, once=True)
 
         self.add_listener(listener, event, once=True)
-        result = await asyncio.wait_for(future, timeout=timeout)
+
+        try:
+            if timeout is None:
+                # asyncio.wait_for() wraps the future in a task even when
+                # there is no timeout, we can simply await it in that case.
+                result = await future
+            else:
+                result = await asyncio.wait_for(future, timeout=timeout)
+        finally:
+            # the listener is removed on dispatch however if we timed out,
+            # it would still be lying around in listeners.
+            self.remove_listener(listener, event)
 
         if len(result) == 1:
             result = result[0]
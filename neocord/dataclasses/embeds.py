@@ -21,10 +21,13 @@
 # SOFTWARE.
 
 from __future__ import annotations
-from typing import Any, Optional, List, Set, TYPE_CHECKING, Text
+from typing import Any, Dict, FrozenSet, Optional, List, Union, TYPE_CHECKING, Text
+
+from neocord.internal import helpers
 
 if TYPE_CHECKING:
     import datetime
+    from neocord.dataclasses.color import Colour
 
 __all__ = (
     'Embed',
@@ -35,6 +38,26 @@ __all__ = (
     'EmbedThumbnail',
 )
 
+# the default values of embed attributes except fields, used
+# when creating embeds from raw data.
+_EMBED_DEFAULTS = {
+    'title': None,
+    'description': None,
+    'url': None,
+    'timestamp': None,
+    'color': None,
+    'footer': None,
+    'image': None,
+    'thumbnail': None,
+    'video': None,
+    'provider': None,
+    'author': None,
+    'type': 'rich',
+}
+
+# the options that can be passed in Embed initalization.
+_EMBED_OPTIONS = frozenset({'title', 'description', 'url', 'timestamp'})
+
 class Embed:
     """
     A class that provides an easy to handle interface for creating and managing
@@ -42,6 +65,11 @@ class Embed:
 
     This class implements some helpers that make management of embeds easy.
     """
+    __slots__ = (
+        'title', 'description', 'url', 'timestamp', '_color', 'footer',
+        'image', 'thumbnail', 'video', 'provider', 'author', 'fields', 'type',
+    )
+
     if TYPE_CHECKING:
         timestamp: Optional[datetime.datetime]
         footer: Optional[EmbedFooter]
@@ -49,24 +77,40 @@ class Embed:
         fields: List[EmbedField]
 
     def __init__(self, **options: Any) -> None:
-        self.title = options.get('title')
-        self.description = options.get('description')
-        self.url = options.get('url')
-        self.timestamp = options.get('timestamp')
+        self.title = self.description = self.url = self.timestamp = None
 
-        self.color = options.get('color')
-        self.colour = options.get('colour')
-
-        self.footer = None
-        self.image = None
-        self.thumbnail = None
-        self.video = None
-        self.provider = None
-        self.author = None
+        self.footer = self.image = self.thumbnail = None
+        self.video = self.provider = self.author = None
         self.fields = []
 
         self.type = 'rich'
 
+        # only the passed options are walked rather than looking up
+        # every option that can be passed.
+        for key, value in options.items():
+            if key in _EMBED_OPTIONS:
+                setattr(self, key, value)
+
+        # colour takes precedence over color if both are passed.
+        colour = options.get('colour')
+        if colour is None:
+            colour = options.get('color')
+
+        self.colour = colour
+
+    @property
+    def colour(self) -> Optional[int]:
+        """Optional[:class:`int`]: The integer color value of embed. An alias :attr:`.color`
+        is also available.
+        """
+        return self._color
+
+    @colour.setter
+    def colour(self, value: Optional[Union[int, Colour]]) -> None:
+        self._color = int(value) if value is not None else None
+
+    color = colour
+
     def create_field(self, **options: Any) -> EmbedField:
         """
         Adds a field in embed at the end.
@@ -199,62 +243,65 @@ class Embed:
 
     def to_dict(self):
         ret = {}
-        if self.title is not None:
-            ret['title'] = self.title
-        if self.description is not None:
-            ret['description'] = self.description
-        if self.url is not None:
-            ret['url'] = self.url
-        if self.timestamp is not None:
-            ret['timestamp'] = self.timestamp.isoformat()
-        if self.color is not None:
-            ret['color'] = int(self.color)
-        if self.colour is not None:
-            ret['color'] = int(self.colour)
-        if self.footer is not None:
-            ret['footer'] = self.footer.to_dict()
-        if self.author is not None:
-            ret['author'] = self.author.to_dict()
-        if self.fields:
-            ret['fields'] = []
-            for field in self.fields:
-                ret['fields'].append(field.to_dict())
-        if self.thumbnail:
-            ret['thumbnail'] = self.thumbnail.to_dict()
-        if self.image:
-            ret['image'] = self.image.to_dict()
 
+        title = self.title
+        if title is not None:
+            ret['title'] = title
+        description = self.description
+        if description is not None:
+            ret['description'] = description
+        url = self.url
+        if url is not None:
+            ret['url'] = url
+        timestamp = self.timestamp
+        if timestamp is not None:
+            ret['timestamp'] = timestamp.isoformat()
+
+        color = self._color
+        if color is not None:
+            ret['color'] = color
+
+        footer = self.footer
+        if footer is not None:
+            ret['footer'] = footer.to_dict()
+        author = self.author
+        if author is not None:
+            ret['author'] = author.to_dict()
+        fields = self.fields
+        if fields:
+            ret['fields'] = [field.to_dict() for field in fields]
+        thumbnail = self.thumbnail
+        if thumbnail:
+            ret['thumbnail'] = thumbnail.to_dict()
+        image = self.image
+        if image:
+            ret['image'] = image.to_dict()
 
         return ret
 
     @classmethod
     def from_dict(cls, data: Any) -> Embed:
-        # create an empty embed and populate it by data we have.
-        embed = cls()
-
-        objects = {
-            'fields': EmbedField,
-            'image': EmbedImage,
-            'thumbnail': EmbedThumbnail,
-            'footer': EmbedFooter,
-            'author': EmbedAuthor,
-        }
-
-        for key in data:
-            item = data[key]
-            if key in objects:
-                obj = objects[key]
-                if isinstance(item, list):
-                    setattr(embed, key, [obj(**i) for i in item]) # type: ignore
-                else:
-                    setattr(embed, key, obj(**item))
+        # initalization is bypassed here so every attribute is only
+        # set once from the data we have.
+        embed = cls.__new__(cls)
+
+        for key, default in _EMBED_DEFAULTS.items():
+            item = data.get(key)
+            if item is None:
+                item = default
             else:
-                setattr(embed, key, data[key])
+                component = _EMBED_COMPONENTS.get(key)
+                if component is not None:
+                    item = component._from_data(item)
 
+            setattr(embed, key, item)
+
+        embed.timestamp = helpers.iso_to_datetime(embed.timestamp)
+        embed.fields = [EmbedField._from_data(field) for field in data.get('fields', [])]
         return embed
 
 class BaseEmbedComponent:
-    VALID_KEYS: Set[str] = set()
+    VALID_KEYS: FrozenSet[str] = frozenset()
 
     def __init__(self, **options: Any) -> None:
         invalid = options.keys() - self.VALID_KEYS
@@ -263,6 +310,15 @@ class BaseEmbedComponent:
 
         self.__dict__.update(options)
 
+    @classmethod
+    def _from_data(cls, data: Dict[str, Any]):
+        # a fast constructor for data received from Discord that skips
+        # the validation. data must be a dict owned by the caller as it
+        # is used as the instance's __dict__ directly.
+        self = cls.__new__(cls)
+        self.__dict__ = data
+        return self
+
     def to_dict(self) -> dict:
         return self.__dict__
 
@@ -282,7 +338,7 @@ class EmbedAuthor(BaseEmbedComponent):
     proxy_icon_url: :class:`str`
         The proxied URL to the image used as author's icon.
     """
-    VALID_KEYS = ('name', 'url', 'icon_url', 'proxy_icon_url')
+    VALID_KEYS = frozenset({'name', 'url', 'icon_url', 'proxy_icon_url'})
 
 
 class EmbedFooter(BaseEmbedComponent):
@@ -303,7 +359,7 @@ class EmbedFooter(BaseEmbedComponent):
         icon_url: str
         proxy_icon_url: str
 
-    VALID_KEYS = ('text', 'icon_url', 'proxy_icon_url')
+    VALID_KEYS = frozenset({'text', 'icon_url', 'proxy_icon_url'})
 
 
 class EmbedField(BaseEmbedComponent):
@@ -324,7 +380,7 @@ class EmbedField(BaseEmbedComponent):
         value: str
         inline: bool
 
-    VALID_KEYS = ('name', 'value', 'inline')
+    VALID_KEYS = frozenset({'name', 'value', 'inline'})
 
 class BaseEmbedAsset(BaseEmbedComponent):
     if TYPE_CHECKING:
@@ -333,16 +389,16 @@ class BaseEmbedAsset(BaseEmbedComponent):
         height: int
         width: int
 
-    VALID_KEYS = ('url', 'proxy_url', 'height', 'width')
+    VALID_KEYS = frozenset({'url', 'proxy_url', 'height', 'width'})
 
     def to_dict(self) -> dict:
-        ret = super().to_dict()
-
-        ret.pop('width', None)
-        ret.pop('height', None)
-        ret.pop('proxy_url', None)
+        # only the url can be set by bots, rest of the keys are
+        # filled by Discord.
+        data = self.__dict__
+        if 'url' in data:
+            return {'url': data['url']}
 
-        return ret
+        return {}
 
 class EmbedThumbnail(BaseEmbedAsset):
     """
@@ -376,5 +432,11 @@ class EmbedImage(BaseEmbedAsset):
         The width of image. This field cannot be set by bots.
     """
 
-
-
+# the attributes of embed that are converted to components
+# in Embed.from_dict(). Fields are handled separately.
+_EMBED_COMPONENTS = {
+    'image': EmbedImage,
+    'thumbnail': EmbedThumbnail,
+    'footer': EmbedFooter,
+    'author': EmbedAuthor,
+}
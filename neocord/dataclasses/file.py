@@ -21,10 +21,17 @@
 # SOFTWARE.
 
 from __future__ import annotations
-from typing import Union
+from typing import Optional, Union
 
 import os
 import io
+import stat
+
+# files upto this size are read at once in memory instead
+# of being opened in buffered mode.
+_SMALL_FILE_SIZE = 1024 * 1024
+
+_O_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
 
 class File:
     """
@@ -59,33 +66,76 @@ class File:
         self.description = description
         if isinstance(fp, str):
             self._owner = True
-            self.fp = open(fp, 'rb')
+            self.fp = self._open(fp)
         else:
             self._owner = False
             self.fp = fp
 
         if name is None:
             if isinstance(fp, str):
-                _, self.name = os.path.split(fp)
+                # only the trailing component of path is needed.
+                name = fp.rpartition(os.sep)[2]
+                if os.altsep:
+                    name = name.rpartition(os.altsep)[2]
             else:
-                try:
-                    self.name = getattr(fp, "name")
-                except AttributeError:
-                    self.name = None
-
-        self.spoiler = spoiler
+                name = getattr(fp, 'name', None)
+
+        self._name = name
+        self._spoiler = spoiler
+        self._update_proper_name()
+
+    def _open(self, path: str) -> Union[io.BytesIO, io.BufferedReader]:
+        fd = os.open(path, _O_FLAGS)
+        try:
+            st = os.fstat(fd)
+            if not stat.S_ISREG(st.st_mode) or st.st_size > _SMALL_FILE_SIZE:
+                # the file object takes the ownership of descriptor.
+                return open(fd, 'rb')
+
+            # small files like emojis or icons are read at once since
+            # they are uploaded as a whole anyway. The size is only a hint,
+            # some files (e.g procfs) report 0 so it's read till EOF.
+            chunks = []
+            while True:
+                chunk = os.read(fd, _SMALL_FILE_SIZE)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        except BaseException:
+            os.close(fd)
+            raise
+
+        os.close(fd)
+        return io.BytesIO(b''.join(chunks))
+
+    def _update_proper_name(self) -> None:
+        name = self._name
+        if name is not None and self._spoiler:
+            name = 'SPOILER_' + name
+
+        self._proper_name = name
 
     @property
-    def proper_name(self) -> Optional[str]:
-        if self.name is None:
-            return None
+    def name(self) -> Optional[str]:
+        return self._name
 
-        ret = self.name
+    @name.setter
+    def name(self, value: Optional[str]) -> None:
+        self._name = value
+        self._update_proper_name()
 
-        if self.spoiler:
-            ret = 'SPOILER_' + ret
+    @property
+    def spoiler(self) -> bool:
+        return self._spoiler
+
+    @spoiler.setter
+    def spoiler(self, value: bool) -> None:
+        self._spoiler = value
+        self._update_proper_name()
 
-        return ret
+    @property
+    def proper_name(self) -> Optional[str]:
+        return self._proper_name
 
     def close(self):
         if self._owner:
@@ -21,12 +21,16 @@
 # SOFTWARE.
 
 from __future__ import annotations
-from typing import Any, Optional, Set, Callable
+from typing import Any, Optional, FrozenSet, Dict, Callable, Iterable
+
+import sys
 
 # Inspired by Discord.py
 
 
 class flag:
+    # only a marker, BaseFlags.__init_subclass__ replaces these with
+    # generated properties, see _flag_property().
     def __init__(self, func: Callable[[Any], int]):
         self.func = func
         self.value = func(None)
@@ -34,42 +38,202 @@ class flag:
         self.__doc__ = func.__doc__
         self.__name__ = func.__name__
 
-    def __get__(self, instance: Optional[BaseFlags], *_: Any):
-        if not instance:
-            return self.value
+    def __repr__(self):
+        return f'<flag value={self.value}>'
 
-        return (self.value & instance.value) == self.value
 
-    def __set__(self, instance: Optional[BaseFlags], val: bool):
-        if not instance:
-            return
+def _flag_property(name: str, value: int, doc: Optional[str]) -> property:
+    # The flag's value is known at class creation so we generate the
+    # getter and setter with the value inlined as a constant. This
+    # is faster than going through the flag descriptor on every access.
+    source = (
+        'def getter(self):\n'
+        '    return (self._value & {0}) == {0}\n'
+        'def setter(self, toggle):\n'
+        '    if toggle:\n'
+        '        self._value |= {0}\n'
+        '    else:\n'
+        '        self._value &= {1}\n'
+    ).format(value, ~value)
 
-        exists = (self.value & instance.value) == self.value
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, f'<flag {name}>', 'exec'), namespace)
 
-        if not val and exists:
-            instance._value -= self.value
-        elif val and not exists:
-            instance._value += self.value
+    getter = namespace['getter']
+    setter = namespace['setter']
+    getter.__name__ = setter.__name__ = name
+
+    # the docstrings are interned so the flags sharing a docstring (aliases and
+    # the flags redefined in subclasses) point to a single string object.
+    if doc is not None:
+        doc = sys.intern(doc)
+
+    return property(getter, setter, doc=doc)
 
-    def __repr__(self):
-        return f'<flag value={self.value}>'
+
+def _invalid_flags(flags: BaseFlags, invalid: Iterable[str]) -> None:
+    raise TypeError('Invalid keyword arguments {0} for {1}()'.format(set(invalid), flags.__class__.__name__))
+
+def _flags_init(cls: type, values: Dict[str, int]) -> Callable[..., None]:
+    # Generates an __init__ that takes every flag as a keyword argument
+    # and has the values inlined, avoiding the iteration of arbitrary
+    # keyword arguments.
+    lines = [
+        'def __init__(self, value=None, *, {0}, **invalid):'.format(', '.join(f'{name}=False' for name in values)),
+        '    if invalid:',
+        '        _invalid_flags(self, invalid)',
+        '    if value:',
+        '        self._value = value',
+        '        return',
+        '    new = 0',
+    ]
+    for name, value in values.items():
+        lines.append(f'    if {name}:')
+        lines.append(f'        new |= {value}')
+
+    lines.append('    self._value = new')
+
+    namespace: Dict[str, Any] = {'_invalid_flags': _invalid_flags}
+    exec(compile('\n'.join(lines), f'<{cls.__name__}.__init__>', 'exec'), namespace)
+
+    init = namespace['__init__']
+    init.__qualname__ = f'{cls.__qualname__}.__init__'
+    return init
 
 
 class BaseFlags:
-    VALID_FLAGS: Set[str]
+    __slots__ = ('_value',)
+
+    VALID_FLAGS: FrozenSet[str] = frozenset()
+    ALL: int = 0
+    _FLAG_VALUES: Dict[str, int] = {}
+
+    def __init_subclass__(cls) -> None:
+        super().__init_subclass__()
+
+        # map the flags names to their values once so initalization doesn't
+        # have to go through the descriptors for every flag.
+        values = cls._FLAG_VALUES.copy()
+
+        # aliases i.e flags assigned to multiple names share the same property.
+        properties: Dict[flag, property] = {}
+
+        for name, obj in list(vars(cls).items()):
+            if isinstance(obj, flag):
+                values[name] = obj.value
+                try:
+                    prop = properties[obj]
+                except KeyError:
+                    prop = properties[obj] = _flag_property(obj.__name__, obj.value, obj.__doc__)
+
+                setattr(cls, name, prop)
+
+        cls._FLAG_VALUES = values
+        cls.VALID_FLAGS = frozenset(vars(cls).get('VALID_FLAGS') or values)
+
+        # the value with every flag enabled.
+        mask = 0
+        for value in values.values():
+            mask |= value
+
+        cls.ALL = mask
+
+        if values and '__init__' not in vars(cls):
+            cls.__init__ = _flags_init(cls, values)
+
+        # the raw values are also exposed as upper case constants e.g
+        # MessageFlags.CROSSPOSTED so they can be used in bitwise operations
+        # without the descriptor.
+        for name, value in values.items():
+            setattr(cls, name.upper(), value)
 
     def __init__(self, value: Optional[int] = None, **flags: Any):
-        invalid = set(flags.keys()) - self.VALID_FLAGS
+        # subclasses with flags get a generated __init__ (see _flags_init()),
+        # this path is used when a subclass defines it's own __init__.
+        values = self._FLAG_VALUES
+        invalid = flags.keys() - values.keys()
         if invalid:
-            raise TypeError('Invalid keyword arguments {0} for {1}()'.format(invalid, self.__class__.__name__))
+            _invalid_flags(self, invalid)
 
         if value:
             self._value = value
-        else:
-            self._value = 0
-            for k in flags:
-                if k:
-                    self._value |= getattr(self.__class__, k)
+            return
+
+        new = 0
+        for name, enabled in flags.items():
+            if enabled:
+                new |= values[name]
+
+        self._value = new
+
+    @classmethod
+    def from_value(cls, value: int):
+        """Constructs the flags from a raw integer value.
+
+        This bypasses the initalization and is faster then passing the
+        value to the class constructor.
+
+        Parameters
+        ----------
+        value: :class:`int`
+            The raw integer value of flags.
+        """
+        self = object.__new__(cls)
+        self._value = value
+        return self
+
+    def has(self, mask: int) -> bool:
+        """Checks whether all the flags in the provided mask are enabled.
+
+        Example::
+
+            permissions.has(Permissions.MANAGE_CHANNELS | Permissions.MANAGE_ROLES)
+
+        Parameters
+        ----------
+        mask: :class:`int`
+            The raw value of flags to check, usually made by combining
+            the upper case flag constants.
+
+        Returns
+        -------
+        :class:`bool`
+        """
+        return (self._value & mask) == mask
+
+    def has_any(self, mask: int) -> bool:
+        """Checks whether any of the flags in the provided mask is enabled.
+
+        Parameters
+        ----------
+        mask: :class:`int`
+            The raw value of flags to check, usually made by combining
+            the upper case flag constants.
+
+        Returns
+        -------
+        :class:`bool`
+        """
+        return (self._value & mask) != 0
+
+    if sys.version_info >= (3, 10):
+        def count(self) -> int:
+            """Returns the number of flags that are enabled.
+
+            Returns
+            -------
+            :class:`int`
+            """
+            return self._value.bit_count()
+    else:
+        def count(self) -> int:
+            """Returns the number of flags that are enabled.
+
+            Returns
+            -------
+            :class:`int`
+            """
+            return bin(self._value).count('1')
 
     @property
     def value(self) -> int:
@@ -82,20 +246,70 @@ class BaseFlags:
 
         self._value = new
 
+    def __int__(self) -> int:
+        return self._value
+
+    def _get_other_value(self, other: Any) -> Optional[int]:
+        # the binary operators accept the same flags class or a raw int
+        # e.g the upper case flag constants.
+        if isinstance(other, self.__class__):
+            return other._value
+        if isinstance(other, int):
+            return other
+
+        return None
+
+    def __and__(self, other):
+        value = self._get_other_value(other)
+        if value is None:
+            return NotImplemented
+
+        return self.from_value(self._value & value)
+
+    def __or__(self, other):
+        value = self._get_other_value(other)
+        if value is None:
+            return NotImplemented
+
+        return self.from_value(self._value | value)
+
+    __rand__ = __and__
+    __ror__ = __or__
+
+    def __iand__(self, other):
+        value = self._get_other_value(other)
+        if value is None:
+            return NotImplemented
+
+        self._value &= value
+        return self
+
+    def __ior__(self, other):
+        value = self._get_other_value(other)
+        if value is None:
+            return NotImplemented
+
+        self._value |= value
+        return self
+
+    def __invert__(self):
+        # only the bits of known flags are flipped.
+        return self.from_value(~self._value & self.ALL)
+
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            return other.value == self.value
+            return other._value == self._value
 
         return False
 
     def __ge__(self, other):
         if isinstance(other, self.__class__):
-            return other.value >= self.value
+            return other._value >= self._value
 
         return False
 
     def __le__(self, other):
         if isinstance(other, self.__class__):
-            return other.value <= self.value
+            return other._value <= self._value
 
         return False
\ No newline at end of file
@@ -35,7 +35,7 @@ class GatewayIntents(BaseFlags):
     if in over 100 guilds:
 
     - :attr:`GatewayIntents.members`
-    - :attr:`GatewayIntents.presence`
+    - :attr:`GatewayIntents.presences`
 
     To see a brief list of events that would be recieved over gateway for
     certain intents, See the official
@@ -87,7 +87,12 @@ class GatewayIntents(BaseFlags):
         Returns ``True`` if the DM message reactions intents are enabled.
     scheduled_events: :class:`bool`
         Returns ``True`` if the scheduled events intents are enabled.
+
+    The raw value of each intent is also available as an upper case class
+    attribute, e.g :attr:`GatewayIntents.GUILD_MESSAGES`.
     """
+    __slots__ = ()
+
     VALID_FLAGS = {
         'messages', 'reactions', 'typing', 'guilds', 'members', 'bans', 'emojis_and_stickers',
         'integrations', 'webhooks', 'invites', 'voice_states', 'presences', 'guild_messages',
@@ -95,9 +100,7 @@ class GatewayIntents(BaseFlags):
         'direct_messages_typing', 'direct_messages_reactions', 'scheduled_events'
     }
 
-    def __init__(self, **intents):
-        super().__init__(**intents)
-
+    _UNPRIVILEGED_VALUE: int
 
     @classmethod
     def all(cls) -> GatewayIntents:
@@ -108,8 +111,7 @@ class GatewayIntents(BaseFlags):
         -------
         :class:`GatewayIntents`
         """
-        intents = {flag: True for flag in cls.VALID_FLAGS}
-        return cls(**intents)
+        return cls.from_value(cls.ALL)
 
     @classmethod
     def unprivileged(cls) -> GatewayIntents:
@@ -120,10 +122,7 @@ class GatewayIntents(BaseFlags):
         -------
         :class:`GatewayIntents`
         """
-        intents = cls.all()
-        intents.members = False
-        intents.presences = False
-        return intents
+        return cls.from_value(cls._UNPRIVILEGED_VALUE)
 
     @flag
     def messages(self) -> int:
@@ -200,3 +199,7 @@ class GatewayIntents(BaseFlags):
     @flag
     def scheduled_events(self) -> int:
         return 1 << 16
+
+# this is computed once as unprivileged() is commonly called
+# on every client initalization.
+GatewayIntents._UNPRIVILEGED_VALUE = GatewayIntents.ALL & ~(GatewayIntents.MEMBERS | GatewayIntents.PRESENCES)
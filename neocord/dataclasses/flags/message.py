@@ -46,7 +46,12 @@ class MessageFlags(BaseFlags):
     loading: :class:`bool`
         Returns True if the message is an interaction response and the application is
         currently in "Thinking" state.
+
+    The raw value of each flag is also available as an upper case class
+    attribute, e.g :attr:`MessageFlags.CROSSPOSTED`.
     """
+    __slots__ = ()
+
     VALID_FLAGS = {
         'crossposted', 'crosspost', 'suppress_embeds', 'source_message_deleted', 'urgent',
         'thread_parent', 'ephemeral', 'loading'
@@ -39,7 +39,12 @@ class SystemChannelFlags(BaseFlags):
         Returns True if guild reminders in system channels is enabled.
     suppress_join_notification_replies: :class:`bool`
         Returns True if user are allowed to reply to system channel join messages.
+
+    The raw value of each flag is also available as an upper case class
+    attribute, e.g :attr:`SystemChannelFlags.SUPPRESS_JOIN_NOTIFICATIONS`.
     """
+    __slots__ = ()
+
     VALID_FLAGS = {
         'suppress_join_notifications', 'suppress_premium_subscriptions',
         'suppress_guild_reminder_notifications', 'suppress_join_notification_replies',
@@ -62,7 +62,12 @@ class UserFlags(BaseFlags):
         Returns ``True`` if the has the "Early Verified Bot Developer" badge.
     discord_certified_moderator: :class:`bool`
         Returns ``True`` if the has the "Certified Discord Moderator" badge.
+
+    The raw value of each flag is also available as an upper case class
+    attribute, e.g :attr:`UserFlags.VERIFIED_BOT`.
     """
+    __slots__ = ()
+
     VALID_FLAGS = {
         'discord_employee', 'partnered_server_owner', 'hypesquad_events',
         'bug_hunter_level_1', 'house_bravery', 'house_brilliance', 'house_balance',
@@ -21,8 +21,22 @@
 # SOFTWARE.
 
 from __future__ import annotations
-from typing import List, TYPE_CHECKING
-
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Set, Tuple
+
+# The possible values of "parse" key indexed by a 3-bit value made up
+# of users, roles and everyone options respectively. The tuples are shared
+# by every payload so they are never built on the fly, the strings are
+# identifier-like literals which are already interned by the compiler.
+_PARSE_TABLE: Tuple[Tuple[str, ...], ...] = (
+    (),
+    ('everyone',),
+    ('roles',),
+    ('roles', 'everyone'),
+    ('users',),
+    ('users', 'everyone'),
+    ('users', 'roles'),
+    ('users', 'roles', 'everyone'),
+)
 
 class AllowedMentions:
     """
@@ -45,24 +59,102 @@ class AllowedMentions:
 
     Attributes
     ----------
-    roles: List[:class:`int`]
-        List of roles IDs that will be mentioned by message.
-    users: List[:class:`int`]
-        List of users IDs that will be mentioned by message.
+    roles: FrozenSet[:class:`int`]
+        Set of roles IDs that will be mentioned by message. This is read-only,
+        use :meth:`.add_role` and :meth:`.remove_role` or assign a new value to modify it.
+    users: FrozenSet[:class:`int`]
+        Set of users IDs that will be mentioned by message. This is read-only,
+        use :meth:`.add_user` and :meth:`.remove_user` or assign a new value to modify it.
     """
+    __slots__ = (
+        '_mention_users', '_mention_roles', '_mention_everyone_here', '_mention_replied_user',
+        '_mentions', '_cached_dict',
+    )
+
     def __init__(self, *,
         mention_users: bool = True,
         mention_roles: bool = True,
         mention_everyone_here: bool = True,
         mention_replied_user: bool = True
         ):
-        self.mention_users = mention_users
-        self.mention_roles = mention_roles
-        self.mention_everyone_here = mention_everyone_here
-        self.mention_replied_user = mention_replied_user
+        self._mention_users = bool(mention_users)
+        self._mention_roles = bool(mention_roles)
+        self._mention_everyone_here = bool(mention_everyone_here)
+        self._mention_replied_user = bool(mention_replied_user)
+
+        # the IDs of roles and users to mention, stored by kind.
+        self._mentions: Dict[str, Set[int]] = {'roles': set(), 'users': set()}
+
+        # the payload returned by to_dict(), reset on every change.
+        self._cached_dict: Optional[Dict[str, Any]] = None
+
+    @property
+    def mention_users(self) -> bool:
+        return self._mention_users
+
+    @mention_users.setter
+    def mention_users(self, value: bool) -> None:
+        self._mention_users = bool(value)
+        self._cached_dict = None
+
+    @property
+    def mention_roles(self) -> bool:
+        return self._mention_roles
+
+    @mention_roles.setter
+    def mention_roles(self, value: bool) -> None:
+        self._mention_roles = bool(value)
+        self._cached_dict = None
+
+    @property
+    def mention_everyone_here(self) -> bool:
+        return self._mention_everyone_here
+
+    @mention_everyone_here.setter
+    def mention_everyone_here(self, value: bool) -> None:
+        self._mention_everyone_here = bool(value)
+        self._cached_dict = None
+
+    @property
+    def mention_replied_user(self) -> bool:
+        return self._mention_replied_user
+
+    @mention_replied_user.setter
+    def mention_replied_user(self, value: bool) -> None:
+        self._mention_replied_user = bool(value)
+        self._cached_dict = None
+
+    @property
+    def roles(self) -> FrozenSet[int]:
+        # a frozenset is returned so the IDs can't be modified in place
+        # without resetting the cached payload.
+        return frozenset(self._mentions['roles'])
+
+    @roles.setter
+    def roles(self, value: Iterable[int]) -> None:
+        self._mentions['roles'] = set(value)
+        self._cached_dict = None
+
+    @property
+    def users(self) -> FrozenSet[int]:
+        return frozenset(self._mentions['users'])
+
+    @users.setter
+    def users(self, value: Iterable[int]) -> None:
+        self._mentions['users'] = set(value)
+        self._cached_dict = None
+
+    def _toggle(self, kind: str, id: int, add: bool) -> None:
+        ids = self._mentions[kind]
+        if add:
+            ids.add(id)
+        elif id in ids:
+            ids.discard(id)
+        else:
+            # nothing changed, keep the cached payload.
+            return
 
-        self.roles: List[int] = []
-        self.users: List[int] = []
+        self._cached_dict = None
 
     def add_role(self, role: int):
         """Adds a specific role that will be mentioned in message.
@@ -72,7 +164,7 @@ class AllowedMentions:
         role: :class:`int`
             The role ID that will be mentioned.
         """
-        return self.roles.append(role)
+        self._toggle('roles', role, True)
 
     def add_user(self, user: int):
         """Adds a specific user that will be mentioned in message.
@@ -82,7 +174,7 @@ class AllowedMentions:
         user: :class:`int`
             The user ID that will be mentioned.
         """
-        return self.users.append(user)
+        self._toggle('users', user, True)
 
     def remove_role(self, role: int):
         """Removes a specific role from list of roles that will be mentioned.
@@ -95,10 +187,7 @@ class AllowedMentions:
         role: :class:`int`
             The role ID to remove.
         """
-        try:
-            self.roles.remove(role)
-        except:
-            return
+        self._toggle('roles', role, False)
 
     def remove_user(self, user: int):
         """Removes a specific user from list of roles that will be mentioned.
@@ -111,30 +200,29 @@ class AllowedMentions:
         user: :class:`int`
             The user ID to remove.
         """
-        try:
-            self.users.remove(user)
-        except:
-            return
+        self._toggle('users', user, False)
 
 
-    def _get_parsed(self):
-        ret = []
-        if self.mention_users:
-            ret.append('users')
-        if self.mention_roles:
-            ret.append('roles')
-        if self.mention_everyone_here:
-            ret.append('everyone')
-
-        return ret
+    def _get_parsed(self) -> Tuple[str, ...]:
+        # the options are always stored as bool so they can be
+        # used for indexing the table directly.
+        return _PARSE_TABLE[(self._mention_users << 2) | (self._mention_roles << 1) | self._mention_everyone_here]
 
     def to_dict(self):
-        return {
-            'parse': self._get_parsed(),
-            'roles': self.roles,
-            'users': self.users,
-            'replied_user': self.mention_replied_user
-        }
+        # the payload is only built again if something has changed since
+        # last call. The returned dict must not be modified and "parse" is
+        # a shared, read-only tuple from _PARSE_TABLE.
+        ret = self._cached_dict
+        if ret is None:
+            mentions = self._mentions
+            ret = self._cached_dict = {
+                'parse': self._get_parsed(),
+                'roles': list(mentions['roles']),
+                'users': list(mentions['users']),
+                'replied_user': self._mention_replied_user
+            }
+
+        return ret
 
     @classmethod
     def none(cls) -> AllowedMentions:
@@ -21,10 +21,9 @@
 # SOFTWARE.
 
 from __future__ import annotations
-from typing import Union, Literal, TYPE_CHECKING, Iterator, Tuple
+from typing import Any, Dict, Optional, Union, Literal, TYPE_CHECKING, Tuple
 
 from neocord.dataclasses.flags.base import BaseFlags, flag
-from neocord.internal.missing import MISSING
 
 if TYPE_CHECKING:
     PermissionOverwriteType = Union[Literal[None], bool]
@@ -40,11 +39,17 @@ class Permissions(BaseFlags):
     You can either pass a raw permission bitwise value or permissions as keyword
     arguments to initalize an instance of this class.
 
+    The raw value of each permission is also available as an upper case class
+    attribute, e.g :attr:`Permissions.KICK_MEMBERS`. These can be combined using
+    bitwise operators.
+
     Parameters
     ----------
     value: :class:`int`
         The raw permissions value.
     """
+    __slots__ = ()
+
     VALID_FLAGS = {
         'create_instant_invite', 'kick_members', 'ban_members', 'administrator',
         'manage_channels', 'manage_channel', 'manage_guild', 'add_reactions',
@@ -59,6 +64,16 @@ class Permissions(BaseFlags):
         'start_embedded_activites',
     }
 
+    @classmethod
+    def all(cls) -> Permissions:
+        """Constructs a :class:`Permissions` with all permissions enabled.
+
+        Returns
+        -------
+        :class:`Permissions`
+        """
+        return cls.from_value(cls.ALL)
+
     @flag
     def create_instant_invite(self) -> int:
         """
@@ -93,15 +108,11 @@ class Permissions(BaseFlags):
     def manage_channels(self) -> int:
         """
         :class:`bool`: Indicates if user can manage the guild channels or not.
+        An alias :attr:`.manage_channel` is also available.
         """
         return 1 << 4
 
-    @flag
-    def manage_channel(self) -> int:
-        """
-        An alias for :attr:`.manage_channels`
-        """
-        return 1 << 4
+    manage_channel = manage_channels
 
     @flag
     def manage_guild(self) -> int:
@@ -142,17 +153,11 @@ class Permissions(BaseFlags):
     def view_channels(self) -> int:
         """
         :class:`bool`: Indicates if the user can view the channels including reading
-        messages of the channels.
+        messages of the channels. An alias :attr:`.view_channel` is also available.
         """
         return 1 << 10
 
-
-    @flag
-    def view_channel(self) -> int:
-        """
-        An alias for :attr:`.view_channels`.
-        """
-        return 1 << 10
+    view_channel = view_channels
 
     @flag
     def send_messages(self) -> int:
@@ -365,13 +370,62 @@ class Permissions(BaseFlags):
         """
         return 1 << 39
 
-def _fill_default_overwrite_values(cls):
-    for key in Permissions.VALID_FLAGS:
-        setattr(cls, key, None)
+class _overwrite_flag:
+    # A permission of PermissionOverwrite, stored as a bit in either
+    # the allow or deny mask of the overwrite.
+    def __init__(self, name: str, value: int, doc: Optional[str] = None):
+        self.value = value
+
+        self.__name__ = name
+        self.__doc__ = doc
+
+    def __get__(self, instance: Optional[PermissionOverwrite], *_: Any):
+        if instance is None:
+            return self
+
+        value = self.value
+        if instance._allow & value:
+            return True
+        if instance._deny & value:
+            return False
+
+        return None
+
+    def __set__(self, instance: PermissionOverwrite, toggle: PermissionOverwriteType):
+        value = self.value
+
+        if toggle is True:
+            instance._allow |= value
+            instance._deny &= ~value
+        elif toggle is False:
+            instance._deny |= value
+            instance._allow &= ~value
+        elif toggle is None:
+            instance._allow &= ~value
+            instance._deny &= ~value
+        else:
+            raise TypeError("Value for {} expected to be NoneType or bool, Got {} instead.".format(self.__name__, toggle.__class__.__name__))
+
+    def __repr__(self):
+        return f'<overwrite_flag value={self.value}>'
+
+def _fill_overwrite_flags(cls):
+    # aliases share the property on Permissions so they share
+    # the overwrite descriptor too.
+    flags: Dict[property, _overwrite_flag] = {}
+
+    for key, value in Permissions._FLAG_VALUES.items():
+        prop = getattr(Permissions, key)
+        try:
+            descriptor = flags[prop]
+        except KeyError:
+            descriptor = flags[prop] = _overwrite_flag(prop.fget.__name__, value, prop.__doc__)
+
+        setattr(cls, key, descriptor)
 
     return cls
 
-@_fill_default_overwrite_values
+@_fill_overwrite_flags
 class PermissionOverwrite:
     """Represents a permission overwrite for a specific channel.
 
@@ -382,14 +436,20 @@ class PermissionOverwrite:
 
     This class takes same parameters (permissions) as :class:`Permissions`.
     """
-    def __init__(self, **perms: Any):
-        for key, value in perms.items():
-            if not key in Permissions.VALID_FLAGS:
-                raise TypeError("{} is not a valid permission.".format(key))
+    __slots__ = ('_allow', '_deny')
+
+    def __init__(self, **perms: PermissionOverwriteType):
+        # the allowed and denied permissions are stored as two bitwise values,
+        # a permission that is in neither of them is not overwritten.
+        self._allow = 0
+        self._deny = 0
 
-            if not value in {True, False, None}:
-                raise TypeError("Value for {} expected to be NoneType or bool, Got {} instead.".format(key, value.__class__.__name__))
+        invalid = perms.keys() - Permissions.VALID_FLAGS
+        if invalid:
+            raise TypeError("{} is not a valid permission.".format(', '.join(sorted(invalid))))
 
+        # the values are validated by the descriptors.
+        for key, value in perms.items():
             setattr(self, key, value)
 
     def pair(self) -> Tuple[Permissions, Permissions]:
@@ -401,24 +461,14 @@ class PermissionOverwrite:
         -------
         Tuple[:class:`Permissions`, :class:`Permissions`]
         """
-        allow = Permissions(0)
-        deny = Permissions(0)
-
-        for flag in Permissions.VALID_FLAGS:
-            val = getattr(self, flag, MISSING)
-
-            if val is False:
-                setattr(deny, flag, True)
-            elif val is True:
-                setattr(allow, flag, True)
-
-        return allow, deny
-
+        return Permissions.from_value(self._allow), Permissions.from_value(self._deny)
 
     @classmethod
     def from_pair(cls, allow: Permissions, deny: Permissions) -> PermissionOverwrite:
         """Creates a permission overwrite with allow, deny permissions pair.
 
+        If a permission is present in both, it is considered denied.
+
         Parameters
         ----------
         allow: :class:`Permissions`
@@ -431,28 +481,7 @@ class PermissionOverwrite:
         :class:`PermissionOverwrite`
             The created permission overwrite.
         """
-        overwrite = cls()
-
-        for key in allow.VALID_FLAGS:
-            value = getattr(allow, key)
-            if value is True:
-                setattr(overwrite, key, True)
-
-        for key in deny.VALID_FLAGS:
-            value = getattr(deny, key)
-            if value is True:
-                setattr(overwrite, key, False)
-
+        overwrite = cls.__new__(cls)
+        overwrite._deny = deny.value
+        overwrite._allow = allow.value & ~overwrite._deny
         return overwrite
-
-    def __setattr__(self, name: str, value: PermissionOverwriteType):
-        if name.startswith('_'):
-            pass
-        else:
-            if not name in Permissions.VALID_FLAGS:
-                raise TypeError("{} is not a valid permission.".format(name))
-
-            if not value in (None, True, False):
-                raise TypeError("Value for {} expected to be NoneType or bool, Got {} instead.".format(key, value.__class__.__name__))
-
-        return super().__setattr__(name, value)
\ No newline at end of file
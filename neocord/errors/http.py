@@ -21,7 +21,7 @@
 # SOFTWARE.
 
 from __future__ import annotations
-from typing import Any, ClassVar, Dict, TYPE_CHECKING
+from typing import Any, ClassVar, Dict, Type, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from aiohttp import ClientResponse
@@ -41,11 +41,38 @@ class HTTPError(Exception):
     """
     DEFAULT_ERROR_MESSAGE: ClassVar[str] = 'An HTTP error occured.'
 
+    # the error classes for specific status codes, set at the bottom
+    # of this module.
+    _STATUS_MAP: ClassVar[Dict[int, Type[HTTPError]]]
+
     def __init__(self, response: ClientResponse, data:  Dict[str, Any]) -> None:
         self.response = response
         self.data = data
 
-        super().__init__(data.get('message', self.DEFAULT_ERROR_MESSAGE))
+        message = data.get('message')
+        super().__init__(message if message is not None else self.DEFAULT_ERROR_MESSAGE)
+
+    @classmethod
+    def from_response(cls, response: ClientResponse, data: Dict[str, Any]) -> HTTPError:
+        """Creates the appropriate error for the status code of a response.
+
+        Parameters
+        ----------
+        response: :class:`aiohttp.ClientResponse`
+            The HTTP request response.
+        data: :class:`dict`
+            The raw data of the response. This is not used for the 500s
+            status codes.
+
+        Returns
+        -------
+        :exc:`HTTPError`
+        """
+        status = response.status
+        if status >= 500:
+            return HTTPRequestFailed(response)
+
+        return cls._STATUS_MAP.get(status, HTTPError)(response, data)
 
 class NotFound(HTTPError):
     """
@@ -73,5 +100,19 @@ class HTTPRequestFailed(HTTPError):
     This class inherits :exc:`HTTPException`.
     """
     def __init__(self, response: ClientResponse) -> None:
-        # a fake kind of response data
-        super().__init__(response, {'message': 'HTTP request failed, Returned with status {}'.format(response.status)})
\ No newline at end of file
+        # these responses have no data, the message is only built
+        # when the error is actually shown.
+        self.response = response
+        self.data = {}
+
+        Exception.__init__(self, response.status)
+
+    def __str__(self) -> str:
+        return f'HTTP request failed, Returned with status {self.response.status}'
+
+
+HTTPError._STATUS_MAP = {
+    401: Forbidden,
+    403: Forbidden,
+    404: NotFound,
+}
@@ -23,7 +23,7 @@
 # This module exists to avoid circular imports.
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Type, Any
+from typing import TYPE_CHECKING, Dict, Type, Any
 
 
 from neocord.models.channels import (
@@ -41,22 +41,21 @@ from neocord.models.stickers import (
     GuildSticker,
 )
 
-def channel_factory(ctype: int) -> Type[GuildChannel]:
-    if ctype == ChannelType.TEXT:
-        return TextChannel
-    if ctype == ChannelType.CATEGORY:
-        return CategoryChannel
-    if ctype == ChannelType.VOICE:
-        return VoiceChannel
-    if ctype == ChannelType.STAGE:
-        return StageChannel
+# the model classes mapped to the channel and sticker types.
+_CHANNEL_TYPES: Dict[int, Type[GuildChannel]] = {
+    ChannelType.TEXT: TextChannel,
+    ChannelType.CATEGORY: CategoryChannel,
+    ChannelType.VOICE: VoiceChannel,
+    ChannelType.STAGE: StageChannel,
+}
 
-    return GuildChannel
+_STICKER_TYPES: Dict[int, Type[Sticker]] = {
+    StickerType.STANDARD: StandardSticker,
+    StickerType.GUILD: GuildSticker,
+}
 
-def sticker_factory(stype: int) -> Type[Sticker]:
-    if stype == StickerType.STANDARD:
-        return StandardSticker
-    if stype == StickerType.GUILD:
-        return GuildSticker
+def channel_factory(ctype: int) -> Type[GuildChannel]:
+    return _CHANNEL_TYPES.get(ctype, GuildChannel)
 
-    return Sticker
\ No newline at end of file
+def sticker_factory(stype: int) -> Type[Sticker]:
+    return _STICKER_TYPES.get(stype, Sticker)
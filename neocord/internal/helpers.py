@@ -33,45 +33,58 @@ if TYPE_CHECKING:
     from neocord.dataclasses.embeds import Embed
     from neocord.dataclasses.mentions import AllowedMentions
 
+# the signatures of PNG and GIF images mapped to their MIME types, PNG has
+# an 8 bytes long signature and GIF has 6 bytes long signatures.
+_IMAGE_SIGNATURES: Dict[bytes, str] = {
+    b"\x89\x50\x4E\x47\x0D\x0A\x1A\x0A": "image/png",
+    b"\x47\x49\x46\x38\x37\x61": "image/gif",
+    b"\x47\x49\x46\x38\x39\x61": "image/gif",
+}
+
+# the data URI prefix for each supported MIME type.
+_DATA_URI_PREFIXES: Dict[str, str] = {
+    mime: f"data:{mime};base64,"
+    for mime in ("image/png", "image/jpeg", "image/gif", "image/webp")
+}
+
 def get_image_data(data: Optional[bytes]) -> Optional[str]:
     if data is None or data is MISSING:
         return None
 
-    if data.startswith(b"\x89\x50\x4E\x47\x0D\x0A\x1A\x0A"):
-        mime = "image/png"
-    elif data[0:3] == b"\xff\xd8\xff" or data[6:10] in (b"JFIF", b"Exif"):
-        mime = "image/jpeg"
-    elif data.startswith((b"\x47\x49\x46\x38\x37\x61", b"\x47\x49\x46\x38\x39\x61")):
-        mime = "image/gif"
-    elif data.startswith(b"RIFF") and data[8:12] == b"WEBP":
-        mime = "image/webp"
-    else:
-        raise TypeError("invalid or unsupported image type was provided, valid types are jpeg, png, gif, webp")
+    mime = _IMAGE_SIGNATURES.get(data[:8])
 
-    data = base64.b64encode(data)
-    ret = data.decode("ascii")
-    return "data:{0};base64,{1}".format(mime, ret)
+    if mime is None:
+        if data[:3] == b"\xff\xd8\xff" or data[6:10] in (b"JFIF", b"Exif"):
+            mime = "image/jpeg"
+        else:
+            mime = _IMAGE_SIGNATURES.get(data[:6])
 
-def get_snowflake(data: Any, key: str) -> Optional[int]:
-    try:
-        return int(data[key])
-    except:
-        return
+            if mime is None:
+                if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+                    mime = "image/webp"
+                else:
+                    raise TypeError("invalid or unsupported image type was provided, valid types are jpeg, png, gif, webp")
+
+    return _DATA_URI_PREFIXES[mime] + base64.b64encode(data).decode("ascii")
+
+def get_snowflake(data: Dict[str, Any], key: str) -> Optional[int]:
+    # optional fields are either missing or null in most payloads which
+    # is common enough to not rely on catching an exception for it.
+    value = data.get(key)
+    return int(value) if value is not None else None
 
 # alias
 int_or_none = get_snowflake
 
+_fromisoformat = datetime.datetime.fromisoformat
+
 def iso_to_datetime(ts: Optional[str]) -> Optional[datetime.datetime]:
-    if ts:
-        return datetime.datetime.fromisoformat(ts)
+    # this is called for nearly every timestamp in gateway payloads so the
+    # parser is bound once rather than looked up through the module.
+    return _fromisoformat(ts) if ts else None
 
 def get_either_or(either: Any, or_: Any, equ: Any = MISSING):
-    if either is not equ:
-        return either
-    if or_ is not equ:
-        return  equ
-    else:
-        return either or or_
+    return either if either is not equ else or_
 
 def parse_message_create_payload(client, *,
     content: Optional[str] = None,
@@ -85,12 +98,12 @@ def parse_message_create_payload(client, *,
     if embed is not None and embeds is not None:
         raise TypeError('embed and embeds parameter cannot be mixed.')
 
-    payload = {}
-
-    if embed:
-        payload['embeds'] = [embed.to_dict()]
+    if embed is not None:
+        payload: Dict[str, Any] = {'embeds': [embed.to_dict()]}
     elif embeds:
-        payload['embeds'] = [em.to_dict() for em in embeds]
+        payload = {'embeds': [em.to_dict() for em in embeds]}
+    else:
+        payload = {}
 
     if content is not None:
         payload['content'] = content
@@ -106,9 +119,11 @@ def parse_message_create_payload(client, *,
 
     if mention_replied_user is not None:
         if 'allowed_mentions' in payload:
-            payload['allowed_mentions']['replied_user'] = mention_replied_user
+            # to_dict() returns a cached payload so it is copied
+            # rather than modified.
+            payload['allowed_mentions'] = {**payload['allowed_mentions'], 'replied_user': mention_replied_user}
         else:
-            payload['allowed_mentions'] = {'replied_user': True}
+            payload['allowed_mentions'] = {'replied_user': mention_replied_user}
 
     return payload
 
@@ -118,4 +133,4 @@ def get_permissions(data, key='permissions'):
     except (ValueError, KeyError):
         permissions = 0
 
-    return neocord.Permissions(permissions)
+    return neocord.Permissions.from_value(permissions)
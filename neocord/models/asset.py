@@ -21,10 +21,10 @@
 # SOFTWARE.
 
 from __future__ import annotations
-from typing import ClassVar, TYPE_CHECKING
+from typing import ClassVar, FrozenSet
 
-if TYPE_CHECKING:
-    from neocord.api.state import State
+# the sizes supported by the CDN, powers of 2 from 16 to 4096.
+_VALID_SIZES: FrozenSet[int] = frozenset(1 << i for i in range(4, 13))
 
 class CDNAsset:
     """
@@ -41,27 +41,33 @@ class CDNAsset:
     """
     BASE_CDN_URL: ClassVar[str] = 'https://cdn.discordapp.com'
 
-    __slots__ = ('key', '_path', '_state')
+    __slots__ = ('_key', '_path', '_animated', '_url')
 
-    def __init__(self, key: str, path: str, state: State):
-        self.key = key
+    def __init__(self, key: str, path: str):
+        self._key = key
         self._path = path
-        self._state = state
+
+        # assets are never modified after creation so the URL is
+        # built once. The hashes of animated assets start with 'a_'.
+        self._animated = animated = key.startswith('a_')
+        self._url = f'{self.BASE_CDN_URL}{path}/{key}.{"gif" if animated else "png"}'
 
     def __repr__(self):
-        return f'<CDNAsset animated={self.animated} url={self.url}>'
+        return f'<CDNAsset animated={self._animated} url={self._url}>'
+
+    @property
+    def key(self) -> str:
+        return self._key
 
     @property
     def url(self) -> str:
         """Returns the access URL of this asset."""
-        fmt = 'gif' if self.animated else 'png'
-        return f'{self.BASE_CDN_URL}{self._path}/{self.key}.{fmt}'
+        return self._url
 
     @property
     def animated(self) -> bool:
         """Returns a boolean representing, Whether this asset is animated or not."""
-        # the hashes of animated assets start with 'a_'.
-        return self.key.startswith('a_')
+        return self._animated
 
     def with_size(self, size: int) -> str:
         """
@@ -82,7 +88,7 @@ class CDNAsset:
         :class:`str`
             The URL with desired size attached.
         """
-        if not size & (size - 1) and 4096 >= size >= 16:
+        if size not in _VALID_SIZES:
             raise ValueError('size parameter must be a power of 2 between 16 and 4096')
 
-        return self.url + f'?size={size}'
+        return f'{self._url}?size={size}'
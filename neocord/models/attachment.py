@@ -66,13 +66,21 @@ class Attachment(DiscordModel):
         self._update(data)
 
     def _update(self, data: AttachmentPayload):
+        get = data.get
+
         self.id = helpers.get_snowflake(data, 'id') # type: ignore
-        self.filename = data.get('filename')
-        self.description = data.get('description')
-        self.size = helpers.int_or_none(data, 'size')
-        self.content_type = data.get('content_type')
-        self.url = data.get('url')
-        self.proxy_url = data.get('proxy_url')
-        self.height = helpers.int_or_none(data, 'height')
-        self.width = helpers.int_or_none(data, 'width')
-        self.ephemeral = data.get('ephemeral', False)
\ No newline at end of file
+        self.filename = get('filename')
+        self.description = get('description')
+        self.content_type = get('content_type')
+        self.url = get('url')
+        self.proxy_url = get('proxy_url')
+        self.ephemeral = get('ephemeral', False)
+
+        # these are inlined rather than going through helpers.int_or_none
+        # as attachments are created for every message.
+        size = get('size')
+        self.size = int(size) if size is not None else None
+        height = get('height')
+        self.height = int(height) if height is not None else None
+        width = get('width')
+        self.width = int(width) if width is not None else None
\ No newline at end of file
@@ -21,19 +21,22 @@
 # SOFTWARE.
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Tuple, Union
+from types import MappingProxyType
 
 from neocord.internal import helpers
 from neocord.models.base import DiscordModel
 from neocord.models.role import Role
 from neocord.models.member import GuildMember
 from neocord.models.user import User
-from neocord.dataclasses.permissions import PermissionOverwrite
+from neocord.dataclasses.permissions import Permissions, PermissionOverwrite
 
 if TYPE_CHECKING:
     from neocord.models.guild import Guild
     from neocord.models.channels.category import CategoryChannel
 
+_EMPTY_OVERWRITES: Mapping[int, Any] = MappingProxyType({})
+
 class ChannelType:
     TEXT = 0
     DM = 1
@@ -51,6 +54,13 @@ class ChannelOverwriteType:
     ROLE = 0
     MEMBER = 1
 
+# the overwrite types of entities, looked up by the exact class.
+_ENTITY_OVERWRITE_TYPES: Dict[type, int] = {
+    Role: ChannelOverwriteType.ROLE,
+    GuildMember: ChannelOverwriteType.MEMBER,
+    User: ChannelOverwriteType.MEMBER,
+}
+
 class GuildChannel(DiscordModel):
     """
     Base class that implements basic operations for all channels types in a guild.
@@ -91,28 +101,46 @@ class GuildChannel(DiscordModel):
         self._update(data)
 
     def _update(self, data: Any):
-        self.id = helpers.get_snowflake(data, 'id') # type: ignore
-        self.guild_id = helpers.get_snowflake(data, 'guild_id') or self.guild.id
-        self.category_id = helpers.get_snowflake(data, 'parent_id')
+        # channels are created in bulk from guild payloads so the
+        # lookups are bound once.
+        get = data.get
+        get_snowflake = helpers.get_snowflake
+
+        self.id = get_snowflake(data, 'id') # type: ignore
+        self.guild_id = get_snowflake(data, 'guild_id') or self.guild.id
+        self.category_id = get_snowflake(data, 'parent_id')
 
         self.type = int(data['type'])
-        self.position = int(data.get('position', 0))
-        self.name = data.get('name')
+        self.position = int(get('position', 0))
+        self.name = get('name')
 
-        # { (ENTITY_ID, ENTITY_TYPE): OVERWRITE }
-        self._permission_overwrites: Dict[Tuple[int, int], Permission] = {}
         self.permissions = helpers.get_permissions(data)
         self._unroll_overwrites(data)
 
+        # the position or category might have changed.
+        self.guild._channels_version += 1
+
     def _unroll_overwrites(self, data):
-        overwrites = data.get('permission_overwrites', [])
+        overwrites = data.get('permission_overwrites')
 
+        if not overwrites:
+            # channels without overwrites share a single read only mapping.
+            self._permission_overwrites = _EMPTY_OVERWRITES
+            return
+
+        # { (ENTITY_ID << 1) | ENTITY_TYPE: OVERWRITE or (ALLOW, DENY) }
+        self._permission_overwrites: Dict[int, Union[PermissionOverwrite, Tuple[int, int]]] = {}
+
+        # the overwrites are stored as (allow, deny) values and only turned
+        # into PermissionOverwrite when they are requested, most of them
+        # never are.
         for overwrite in overwrites:
             entity_id = int(overwrite['id'])
-            allow = helpers.get_permissions(overwrite, key='allow')
-            deny = helpers.get_permissions(overwrite, key='deny')
 
-            self._permission_overwrites[(entity_id, overwrite['type'])] = PermissionOverwrite.from_pair(allow, deny)
+            # the entity type is either 0 or 1 so it's packed into the ID to
+            # avoid creating a tuple for every lookup.
+            key = (entity_id << 1) | int(overwrite['type'])
+            self._permission_overwrites[key] = (int(overwrite.get('allow', 0)), int(overwrite.get('deny', 0)))
 
     @property
     def category(self) -> Optional[CategoryChannel]:
@@ -139,15 +167,28 @@ class GuildChannel(DiscordModel):
         Optional[:class:`PermissionOverwrite`]
             The permission overwrite for relevant entity.
         """
-        if isinstance(entity, Role):
-            entity_type = ChannelOverwriteType.ROLE
-        elif isinstance(entity, (GuildMember, User)):
-            entity_type = ChannelOverwriteType.MEMBER
-
         try:
-            return self._permission_overwrites[(entity.id, entity_type)]
+            entity_type = _ENTITY_OVERWRITE_TYPES[type(entity)]
         except KeyError:
-            return None
+            # subclasses of the entity types.
+            if isinstance(entity, Role):
+                entity_type = ChannelOverwriteType.ROLE
+            elif isinstance(entity, (GuildMember, User)):
+                entity_type = ChannelOverwriteType.MEMBER
+            else:
+                raise TypeError('entity must be a Role, GuildMember or User, not {}'.format(entity.__class__.__name__))
+
+        key = (entity.id << 1) | entity_type
+        overwrite = self._permission_overwrites.get(key)
+
+        if isinstance(overwrite, tuple):
+            allow, deny = overwrite
+            overwrite = self._permission_overwrites[key] = PermissionOverwrite.from_pair(
+                Permissions.from_value(allow),
+                Permissions.from_value(deny),
+            )
+
+        return overwrite
 
     async def edit(self, **kw: Any) -> None:
         raise NotImplementedError
@@ -38,6 +38,8 @@ class CategoryChannel(GuildChannel):
 
 
     """
+    __slots__ = ('_cached_channels',)
+
     if TYPE_CHECKING:
         def __init__(self, data: Any, guild: Guild):
             ...
@@ -51,7 +53,17 @@ class CategoryChannel(GuildChannel):
         -------
         List[:class:`GuildChannel`]
         """
-        return [c for c in self.guild.channels if c.category_id == self.id]
+        guild = self.guild
+        version = guild._channels_version
+
+        # the channels are only looked up again if the guild's channels
+        # have changed since the last call.
+        cached = getattr(self, '_cached_channels', None)
+        if cached is None or cached[0] != version:
+            channels = [c for c in guild.channels if c.category_id == self.id]
+            cached = self._cached_channels = (version, channels)
+
+        return cached[1].copy()
 
     async def edit(self, *,
         name: Optional[str] = None,
@@ -80,14 +92,13 @@ class CategoryChannel(GuildChannel):
         HTTPError
             The editing of category channel failed somehow.
         """
-        payload = {}
-
-        if name is not None:
-            payload['name'] = name
-        if position is not None:
-            payload['position'] = position
-        if nsfw is not None:
-            payload['nsfw'] = nsfw
+        # (key, value, the value when it wasn't passed)
+        fields = (
+            ('name', name, None),
+            ('position', position, None),
+            ('nsfw', nsfw, None),
+        )
+        payload = {key: value for key, value, default in fields if value is not default}
 
         if payload:
             data = await self._state.http.edit_channel(channel_id=self.id, payload=payload, reason=reason)
@@ -27,6 +27,8 @@ from neocord.models.channels.base import GuildChannel
 from neocord.internal.missing import MISSING
 from neocord.models.stage_instance import StageInstance, StagePrivacyLevel
 
+import sys
+
 if TYPE_CHECKING:
     from neocord.models.base import DiscordModel
 
@@ -56,15 +58,18 @@ class StageChannel(GuildChannel):
 
     def _update(self, data: Any):
         super()._update(data)
-        try:
-            self.bitrate = int(data['bitrate'])
-        except KeyError:
-            self.bitrate = None
+        get = data.get
+
+        bitrate = get('bitrate')
+        self.bitrate = int(bitrate) if bitrate is not None else None
 
-        self.user_limit = int(data.get('user_limit', 0))
-        self.rtc_region = data.get('rtc_region')
-        self.nsfw = data.get('nsfw', False)
-        self.topic = data.get('topic')
+        self.user_limit = int(get('user_limit', 0))
+        # there are only a handful of voice regions so the strings are
+        # interned to be shared across channels.
+        rtc_region = get('rtc_region')
+        self.rtc_region = sys.intern(rtc_region) if rtc_region is not None else None
+        self.nsfw = get('nsfw', False)
+        self.topic = get('topic')
 
     async def edit(self, *,
         name: Optional[str] = None,
@@ -108,28 +113,20 @@ class StageChannel(GuildChannel):
         HTTPError
             The editing of voice channel failed somehow.
         """
-        payload = {}
-
-        if name is not None:
-            payload['name'] = name
-        if nsfw is not None:
-            payload['nsfw'] = nsfw
-        if position is not None:
-            payload['position'] = position
+        # (key, value, the value when it wasn't passed)
+        fields = (
+            ('name', name, None),
+            ('nsfw', nsfw, None),
+            ('position', position, None),
+            ('bitrate', bitrate, None),
+            ('user_limit', user_limit, MISSING),
+            ('rtc_region', rtc_region, None),
+            ('topic', topic, MISSING),
+        )
+        payload = {key: value for key, value, default in fields if value is not default}
+
         if category is not MISSING:
-            if category is None:
-                payload['parent_id'] = None
-            else:
-                payload['parent_id'] = category.id
-
-        if bitrate is not None:
-            payload['bitrate'] = bitrate
-        if user_limit is not MISSING:
-            payload['user_limit'] = user_limit
-        if rtc_region is not None:
-            payload['rtc_region'] = rtc_region
-        if topic is not MISSING:
-            payload['topic'] = topic
+            payload['parent_id'] = None if category is None else category.id
 
         if payload:
             data = await self._state.http.edit_channel(
@@ -145,9 +142,7 @@ class StageChannel(GuildChannel):
         Optional[:class:`StageInstance`]: Returns the live stage instance that is currently
         running in stage channel. Returns None if no instance is running.
         """
-        for instance in self.guild.stage_instances:
-            if instance.channel_id == self.id:
-                return instance
+        return self.guild._stage_instances_by_channel.get(self.id)
 
     async def fetch_instance(self):
         """Fetches a stage instance that is associated with this stage channel.
@@ -172,7 +167,7 @@ class StageChannel(GuildChannel):
             An error occured while fetching.
         """
         data = await self._state.http.get_stage_instance(channel_id=self.id)
-        return StageInstance(data, state=self.state)
+        return StageInstance(data, state=self._state)
 
     async def create_instance(self, *,
         topic: str,
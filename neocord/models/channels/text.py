@@ -32,6 +32,7 @@ from neocord.abc import Messageable
 
 if TYPE_CHECKING:
     from neocord.models.guild import Guild
+    import datetime
 
 class TextChannel(GuildChannel, Messageable):
     """
@@ -53,6 +54,11 @@ class TextChannel(GuildChannel, Messageable):
     nsfw: :class:`bool`
         Whether this channel is marked as not safe for work (NSFW)
     """
+    __slots__ = (
+        'last_message_id', '_last_pin_timestamp', '_last_pin_datetime', 'rate_limit_per_user',
+        'topic', 'nsfw',
+    )
+
     if TYPE_CHECKING:
 
         def __init__(self, data: Any, guild: Guild) -> None:
@@ -64,12 +70,22 @@ class TextChannel(GuildChannel, Messageable):
 
         # adding text channel specific attributes
         self.last_message_id = helpers.get_snowflake(data, 'last_message_id')
-        self.last_pin_timestamp = helpers.iso_to_datetime(data.get('last_pin_timestamp'))
+        # the timestamp is only parsed when it's accessed.
+        self._last_pin_timestamp = data.get('last_pin_timestamp')
+        self._last_pin_datetime = MISSING
 
         self.rate_limit_per_user = int(data.get('rate_limit_per_user', 0))
         self.topic = data.get('topic')
         self.nsfw = data.get('nsfw', False)
 
+    @property
+    def last_pin_timestamp(self) -> Optional[datetime.datetime]:
+        ret = self._last_pin_datetime
+        if ret is MISSING:
+            ret = self._last_pin_datetime = helpers.iso_to_datetime(self._last_pin_timestamp)
+
+        return ret
+
     def is_news(self) -> bool:
         """
         Returns a boolean that indicates if the channel is a news aka announcement
@@ -145,25 +161,19 @@ class TextChannel(GuildChannel, Messageable):
         HTTPError
             The editing of text channel failed somehow.
         """
-        payload = {}
-
-        if name is not None:
-            payload['name'] = name
-        if topic is not MISSING:
-            payload['topic'] = topic
-        if nsfw is not None:
-            payload['nsfw'] = nsfw
-        if position is not None:
-            payload['position'] = position
-        if rate_limit_per_user is not MISSING:
-            payload['rate_limit_per_user'] = rate_limit_per_user
-        if default_auto_archive_duration is not MISSING:
-            payload['default_auto_archive_duration'] = default_auto_archive_duration
+        # (key, value, the value when it wasn't passed)
+        fields = (
+            ('name', name, None),
+            ('topic', topic, MISSING),
+            ('nsfw', nsfw, None),
+            ('position', position, None),
+            ('rate_limit_per_user', rate_limit_per_user, MISSING),
+            ('default_auto_archive_duration', default_auto_archive_duration, MISSING),
+        )
+        payload = {key: value for key, value, default in fields if value is not default}
+
         if category is not MISSING:
-            if category is None:
-                payload['parent_id'] = None
-            else:
-                payload['parent_id'] = category.id
+            payload['parent_id'] = None if category is None else category.id
 
         if payload:
             data = await self._state.http.edit_channel(
@@ -28,6 +28,8 @@ from typing import Optional, TYPE_CHECKING, Any
 from neocord.models.channels.base import GuildChannel
 from neocord.internal.missing import MISSING
 
+import sys
+
 if TYPE_CHECKING:
     from neocord.models.guild import Guild
 
@@ -61,13 +63,14 @@ class VoiceChannel(GuildChannel):
 
     def _update(self, data: Any):
         super()._update(data)
-        try:
-            self.bitrate = int(data['bitrate'])
-        except KeyError:
-            self.bitrate = None
+        bitrate = data.get('bitrate')
+        self.bitrate = int(bitrate) if bitrate is not None else None
 
         self.user_limit = int(data.get('user_limit', 0))
-        self.rtc_region = data.get('rtc_region')
+        # there are only a handful of voice regions so the strings are
+        # interned to be shared across channels.
+        rtc_region = data.get('rtc_region')
+        self.rtc_region = sys.intern(rtc_region) if rtc_region is not None else None
         # int cast this?
         self.video_quality_mode = data.get('video_quality_mode')
         self.nsfw = data.get('nsfw', False)
@@ -114,28 +117,20 @@ class VoiceChannel(GuildChannel):
         HTTPError
             The editing of voice channel failed somehow.
         """
-        payload = {}
-
-        if name is not None:
-            payload['name'] = name
-        if nsfw is not None:
-            payload['nsfw'] = nsfw
-        if position is not None:
-            payload['position'] = position
+        # (key, value, the value when it wasn't passed)
+        fields = (
+            ('name', name, None),
+            ('nsfw', nsfw, None),
+            ('position', position, None),
+            ('bitrate', bitrate, None),
+            ('user_limit', user_limit, MISSING),
+            ('rtc_region', rtc_region, None),
+            ('video_quality_mode', video_quality_mode, None),
+        )
+        payload = {key: value for key, value, default in fields if value is not default}
+
         if category is not MISSING:
-            if category is None:
-                payload['parent_id'] = None
-            else:
-                payload['parent_id'] = category.id
-
-        if bitrate is not None:
-            payload['bitrate'] = bitrate
-        if user_limit is not MISSING:
-            payload['user_limit'] = user_limit
-        if rtc_region is not None:
-            payload['rtc_region'] = rtc_region
-        if video_quality_mode is not None:
-            payload['video_quality_mode'] = video_quality_mode
+            payload['parent_id'] = None if category is None else category.id
 
         if payload:
             data = await self._state.http.edit_channel(
@@ -21,7 +21,7 @@
 # SOFTWARE.
 
 from __future__ import annotations
-from typing import List, Optional, Any, TYPE_CHECKING
+from typing import Dict, List, Optional, Any, Tuple, TYPE_CHECKING
 
 from neocord.models.base import DiscordModel
 from neocord.models.asset import CDNAsset
@@ -125,7 +125,8 @@ class Guild(DiscordModel):
         'system_channel_id', 'rules_channel_id', 'public_updates_channel_id', 'system_channel_flags',
         '_joined_at', 'verification_level', 'default_message_notifications', 'explicit_content_filter',
         'mfa_level', 'premium_tier', 'nsfw_level', '_icon', '_splash', '_banner', '_discovery_splash',
-        'welcome_screen', 'features', '_roles', '_scheduled_events',
+        'welcome_screen', 'features', '_roles', '_scheduled_events', '_channels_version',
+        '_sorted_channels', '_stage_instances_by_channel',
     )
 
     def __init__(self, data: GuildPayload, state: State):
@@ -138,10 +139,17 @@ class Guild(DiscordModel):
         self._stickers: Dict[int, GuildSticker] = {}
         self._members: Dict[int, GuildMember] = {}
         self._channels: Dict[int, GuildChannel] = {}
+
+        # bumped whenever a channel is added, removed or updated so
+        # the results derived from channels can be cached.
+        self._channels_version = 0
+        self._sorted_channels: Optional[Tuple[int, List[GuildChannel]]] = None
         self._emojis: Dict[int, Emoji] = {}
         self._roles: Dict[int, Role] = {}
         self._scheduled_events: Dict[int, ScheduledEvent] = {}
         self._stage_instances: Dict[int, StageInstance] = {}
+        # a stage channel can only have one live instance at a time.
+        self._stage_instances_by_channel: Dict[int, StageInstance] = {}
 
         self._update(data)
 
@@ -189,7 +197,7 @@ class Guild(DiscordModel):
         self.public_updates_channel_id = helpers.get_snowflake(data, 'public_updates_channel_id')
 
         # flags
-        self.system_channel_flags = SystemChannelFlags(data.get('system_channel_flags') or 0)
+        self.system_channel_flags = SystemChannelFlags.from_value(data.get('system_channel_flags') or 0)
 
         # timestamps
         self._joined_at = data.get('joined_at')
@@ -226,7 +234,6 @@ class Guild(DiscordModel):
             return CDNAsset(
                 key=self._icon,
                 path=f'/icons/{self.id}',
-                state=self._state,
             )
 
     @property
@@ -240,7 +247,6 @@ class Guild(DiscordModel):
             return CDNAsset(
                 key=self._splash,
                 path=f'/splashes/{self.id}',
-                state=self._state,
             )
 
     @property
@@ -255,7 +261,6 @@ class Guild(DiscordModel):
             return CDNAsset(
                 key=self._discovery_splash,
                 path=f'/discovery-splashes/{self.id}',
-                state=self._state,
             )
 
     @property
@@ -269,7 +274,6 @@ class Guild(DiscordModel):
             return CDNAsset(
                 key=self._banner,
                 path=f'/banners/{self.id}',
-                state=self._state,
             )
 
 
@@ -479,9 +483,11 @@ class Guild(DiscordModel):
         cls = channel_factory(int(data['type']))
         channel = cls(data, guild=self)
         self._channels[channel.id] = channel
+        self._channels_version += 1
         return channel
 
     def _remove_channel(self, id: int, /) -> Optional[GuildChannel]:
+        self._channels_version += 1
         return self._channels.pop(id, None)
 
     @property
@@ -491,10 +497,15 @@ class Guild(DiscordModel):
         These are sorted in the same way as in the Discord client i.e voice channels
         below other channels.
         """
-        channels = list(self._channels.values())
-        channels.sort(key=lambda c: c.position)
+        version = self._channels_version
+        cached = self._sorted_channels
+
+        if cached is None or cached[0] != version:
+            channels = list(self._channels.values())
+            channels.sort(key=lambda c: c.position)
+            cached = self._sorted_channels = (version, channels)
 
-        return channels
+        return cached[1].copy()
 
     def get_channel(self, id: int, /) -> Optional[GuildChannel]:
         """
@@ -823,10 +834,15 @@ class Guild(DiscordModel):
     def _add_stage_instance(self, data: StageInstancePayload):
         instance = StageInstance(data, state=self._state)
         self._stage_instances[instance.id] = instance
+        self._stage_instances_by_channel[instance.channel_id] = instance
         return instance
 
     def _remove_stage_instance(self, id: int):
-        return self._stage_instances.pop(id, None)
+        instance = self._stage_instances.pop(id, None)
+        if instance is not None:
+            self._stage_instances_by_channel.pop(instance.channel_id, None)
+
+        return instance
 
 
     def get_stage_instance(self, id: int, /) -> Optional[StageInstance]:
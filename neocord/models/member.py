@@ -124,8 +124,7 @@ class GuildMember(DiscordModel):
 
         return CDNAsset(
             key=self._avatar,
-            state=self._state,
-            path=f'guilds/{self.guild.id}/users/{self.id}/avatars'
+            path=f'/guilds/{self.guild.id}/users/{self.id}/avatars'
         )
 
     @property
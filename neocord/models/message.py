@@ -253,7 +253,7 @@ class Message(DiscordModel, _MessageReferenceMixin):
 
         self.attachments = [Attachment(a, state=self._state) for a in data.get('attachments', [])]
         self.embeds = [Embed.from_dict(e) for e in data.get('embeds', [])]
-        self.flags = MessageFlags(data.get('flags', 0))
+        self.flags = MessageFlags.from_value(data.get('flags', 0))
 
     @property
     def guild(self) -> Optional[Guild]:
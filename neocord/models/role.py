@@ -138,7 +138,6 @@ class Role(DiscordModel):
         """
         if self._icon:
             return CDNAsset(
-                state=self._state,
                 key=self._icon,
                 path=f'/role-icons/{self.id}'
                 )
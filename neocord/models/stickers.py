@@ -203,7 +203,7 @@ class StandardSticker(Sticker):
     def _update(self, data: StickerPayload):
         super()._update(data)
 
-        self.pack_id = helpers.get_snowflake() # type: ignore
+        self.pack_id = helpers.get_snowflake(data, 'pack_id') # type: ignore
 
         try:
             sort_value = int(data['sort_value'])
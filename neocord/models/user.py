@@ -69,7 +69,7 @@ class BaseUser(DiscordModel):
     @property
     def public_flags(self) -> UserFlags:
         """:class:`UserFlags: Returns the public flags of a user."""
-        return UserFlags(value=self._public_flags)
+        return UserFlags.from_value(self._public_flags)
 
     @property
     def avatar(self) -> Optional[CDNAsset]:
@@ -78,7 +78,6 @@ class BaseUser(DiscordModel):
             return CDNAsset(
                 key=self._avatar,
                 path=f'/avatars/{self.id}',
-                state=self._state,
             )
 
     @property
@@ -88,7 +87,6 @@ class BaseUser(DiscordModel):
             return CDNAsset(
                 key=self._banner,
                 path=f'/banners/{self.id}',
-                state=self._state,
             )
 
     @property